@@ -1,10 +1,9 @@
 import sys
-from datetime import datetime
-from random import randint
-from time import sleep
+from functools import partial
+from random import sample
 
-from PySide6.QtCore import Qt, QTimer, Signal
-from PySide6.QtGui import QFont, QPainter, QPixmap
+from PySide6.QtCore import QElapsedTimer, QRect, Qt, QTimer, Signal
+from PySide6.QtGui import QFont, QImage, QPainter, QPixmap
 from PySide6.QtWidgets import (
     QApplication,
     QFileDialog,
@@ -19,6 +18,16 @@ from PySide6.QtWidgets import (
     QWidget,
 )
 
+def inversion_count(permutation):
+    """Returns the number of pairs that are out of order in the permutation"""
+    return sum(
+        1
+        for i, first in enumerate(permutation)
+        for second in permutation[i + 1 :]
+        if first > second
+    )
+
+
 class Tile(QLabel):
     """
     Custom class of a label that can be clicked. It does so by catching the
@@ -27,25 +36,28 @@ class Tile(QLabel):
 
     # Signal to be emitted when the label is clicked
     clicked = Signal()  # for short click
+    # Signals to be emitted when the fading effects are done
+    faded_out = Signal()
+    faded_in = Signal()
 
-    def __init__(self, location, fraction):
+    def __init__(self, location, source_pixmap, source_rect):
         """Initialize the tile."""
         # Initialize the parent class
         super().__init__()
         self._location = location  # Current location of the tile
         self._id = location  # id of the tile (correct location)
-        self.fraction = fraction  # The image fraction to be displayed
+        self._src_pix = source_pixmap  # The whole image
+        self._src_rect = source_rect  # The image fraction to be displayed
+        self.setFixedSize(source_rect.size())
+        # The tile paints all of its pixels, no need to fill its background first
+        self.setAttribute(Qt.WA_OpaquePaintEvent)
+        self.setAttribute(Qt.WA_NoSystemBackground)
         self.current_alpha = 255  # Initial alpha value
-        self.fade_step = 50  # How much to change the alpha value by for fading
-
-        # Timers for fading in and out
-        self.fade_out_timer = QTimer(self)
-        self.fade_out_timer.timeout.connect(self.fade_out)
-        self.fade_in_timer = QTimer(self)
-        self.fade_in_timer.timeout.connect(self.fade_in)
+        self._alpha_cache = {}  # Pre-rendered fraction for each alpha bucket
+        self.fade_step = 64  # How much to change the alpha value by for fading
 
-        # How long to wait between each step of the fade
-        self.fade_step_duration = 1
+        # How long to wait between each step of the fade, about one display frame
+        self.fade_step_duration = 16
 
     def mousePressEvent(self, event):
         """A default qt function that is called when a mouse press event occurs, but
@@ -55,6 +67,13 @@ class Tile(QLabel):
             # If it is then we emit the clicked signal
             self.clicked.emit()
 
+    def teardown(self):
+        """Disconnect the tile signals before it gets deleted, so the tile can no
+        longer reach the gameboard while its deletion is pending."""
+        self.clicked.disconnect()
+        self.faded_out.disconnect()
+        self.faded_in.disconnect()
+
     def is_in_right_place(self):
         """Check if the tile is in the right place by comparing current location with id."""
         return self._location == self._id
@@ -62,36 +81,33 @@ class Tile(QLabel):
     def paintEvent(self, event):
         """Override the paint event to draw the pixmap with the current alpha value."""
         painter = QPainter(self)
-        painter.setOpacity(self.current_alpha / 255)  # Set opacity based on alpha
-        painter.drawPixmap(0, 0, self.fraction)
+        if self.current_alpha < 255:
+            # Draw the pre-rendered fraction for the alpha while fading
+            painter.drawPixmap(0, 0, self._cached(self.current_alpha >> 4))
+        else:
+            painter.drawPixmap(self.rect(), self._src_pix, self._src_rect)
+
+    def _cached(self, alpha_bucket):
+        """Returns the fraction rendered over the background for one of the 16
+        alpha buckets, rendering it on first use."""
+        if alpha_bucket not in self._alpha_cache:
+            image = QImage(self._src_rect.size(), QImage.Format_ARGB32_Premultiplied)
+            painter = QPainter(image)
+            # The tile is see-through while fading, so paint the background under it
+            painter.fillRect(image.rect(), self.palette().window())
+            painter.setOpacity(alpha_bucket / 15)
+            painter.drawPixmap(image.rect(), self._src_pix, self._src_rect)
+            painter.end()
+            self._alpha_cache[alpha_bucket] = QPixmap.fromImage(image)
+        return self._alpha_cache[alpha_bucket]
 
     def fade_out(self):
-        """Fade out the tile by decreasing the alpha value."""
-        # Check if the timer is active if not start it
-        if not self.fade_out_timer.isActive():
-            self.fade_out_timer.start(self.fade_step_duration)
-        # Check if the alpha value is greater than 0
-        if self.current_alpha > 0:
-            # Decrease the alpha value
-            self.current_alpha -= self.fade_step
-            self.update()  # Trigger a repaint to show the updated alpha
-        else:
-            # Stop the timer if the alpha value is less than 0
-            self.fade_out_timer.stop()
+        """Fade out the tile, the steps are driven by the gameboard timer."""
+        self.parentWidget().fade_tile(self, -1)
 
     def fade_in(self):
-        """Fade in the tile by increasing the alpha value."""
-        # Check if the timer is active if not start it
-        if not self.fade_in_timer.isActive():
-            self.fade_in_timer.start(self.fade_step_duration)
-        # Check if the alpha value is less than 255
-        if self.current_alpha < 255:
-            # Increase the alpha value
-            self.current_alpha += self.fade_step
-            self.update()
-        else:
-            # Stop the timer if the alpha value is greater than 255
-            self.fade_in_timer.stop()
+        """Fade in the tile, the steps are driven by the gameboard timer."""
+        self.parentWidget().fade_tile(self, 1)
 
     @property
     def location(self):
@@ -120,16 +136,28 @@ class Gameboard(QWidget):
         self.window_height = window_height
 
         self.current_empty_tile = None  # current empty tile
+        self.moving_tile = None  # tile being moved with the fade effect
+        self._wrong_count = 0  # number of tiles out of their right place
+        self._neighbor_table = {}  # neighbor locations of each grid location
         self.image = None  # holder of the pixmap image
         self.image_label = None  # holder of the whole image label
-        self.image_fraction = {}  # image fractions
-        self.tiles = {}  # holder for tiles
+        self.tiles = []  # holder for tiles, indexed by row * grid_size + col
         self.file_path = None  # file path of the image
 
+        # Single timer driving the fading of the tile being animated
+        self._anim_tile = None  # tile being faded
+        self._anim_dir = 0  # -1 for fading out, 1 for fading in
+        self._anim_timer = QTimer(self)
+        self._anim_timer.timeout.connect(self._tick_fade)
+
         # set up the game grid
         self.gamegrid = QGridLayout()
         self.setLayout(self.gamegrid)
 
+    def tile_index(self, row, col):
+        """Returns the index of the location in the tiles holder"""
+        return row * self.grid_size + col
+
     def get_moveable_tiles(self):
         """Returns a list of tiles that can be moved"""
         moveable_tiles = []
@@ -143,47 +171,37 @@ class Gameboard(QWidget):
 
     def reset_holders(self):
         """Function used to reset the different holders.
-        Used when a new image is loaded or a new game is started.
-        Also used when the game is won."""
+        Used when a new image is loaded or a new game is started."""
+
+        # Stop any running fade before its tile gets deleted
+        self.stop_fade()
+
+        # reset the tiles, skipping the empty one
+        # Updates are held back so the board is laid out and repainted only once
+        updates_enabled = self.updatesEnabled()
+        self.setUpdatesEnabled(False)
+        for tile in self.tiles:
+            if tile is not None:
+                self.gamegrid.removeWidget(tile)
+                tile.teardown()
+                tile.deleteLater()  # delete the tile from the memory ### important
+        self.tiles = []
+        self.setUpdatesEnabled(updates_enabled)
 
         # reset the holders
         self.current_empty_tile = (self.grid_size - 1, self.grid_size - 1)
-        self.image_fraction = {}
-        try:
-            # delete the image label from the memory ### important
-            self.image_label.deleteLater()
-            self.image_label = None
-        except (RuntimeError, AttributeError):
-            # if the image label is not in the memory then pass
-            pass
+        self.moving_tile = None
+        self._wrong_count = 0
 
-        # reset the tiles
-        for col in range(self.grid_size):
-            for row in range(self.grid_size):
-                if self.gamegrid.itemAtPosition(row, col):
-                    self.gamegrid.removeItem(self.gamegrid.itemAtPosition(row, col))
-                    try:
-                        # delete the tile from the memory ### important
-                        self.tiles[(row, col)].deleteLater()
-                    except KeyError:
-                        pass
-        self.tiles = {}
-
-    def tile_clicked(self):
+    def tile_clicked(self, tile):
         """Slot function for when a tile is clicked"""
-        # Check if the game is running
-        if not self.game_running:
+        # Check if the game is running and no other tile is being moved
+        if not self.game_running or self.moving_tile is not None:
             return
-        # Get the tile that was clicked
-        tile = self.sender()
         # Check if the tile can be moved
         if self.moveable_tile(tile.location):
-            # Move the tile
+            # Move the tile, the win check is done once the move is finished
             self.move_tile(tile, "fade")
-            # Check if the game is won
-            if self.check_win():
-                # Set the game to won state
-                self.set_won_state()
 
     def set_won_state(self, emit=True):
         """Function used to set the game to won state"""
@@ -191,14 +209,15 @@ class Gameboard(QWidget):
         if emit:
             self.won_signal.emit()
 
-        # Clear the tiles to show the whole image
-        self.reset_holders()
+        # Stop any running move
+        self.moving_tile = None
+        self.stop_fade()
 
-        # Set up the whole image and show it
-        self.image_label = QLabel()
-        self.image_label.setPixmap(self.image)
-        self.image_label.resize(self.image.width(), self.image.height())
-        self.gamegrid.addWidget(self.image_label, 0, 0)
+        # Hide the tiles to show the whole image, they are deleted on the next shuffle
+        for tile in self.tiles:
+            if tile is not None:
+                tile.hide()
+        self.image_label.show()
 
         # Set the game to not running and reset the counter
         self.game_running = False
@@ -214,138 +233,226 @@ class Gameboard(QWidget):
             self.set_won_state(False)
             return
 
-        # Set the grid size
-        self.grid_size = grid_size
-
-        # Remove the whole image label from the grid
-        self.gamegrid.removeItem(self.gamegrid.itemAtPosition(0, 0))
-        self.image_label.deleteLater()  # delete the image label from the memory ### important
+        # Hold back updates while the tiles are replaced, so the board is laid out
+        # and repainted only once
+        self.setUpdatesEnabled(False)
+
+        if grid_size == self.grid_size and self.tiles:
+            # Same grid size as the previous game, so its tiles are reused and only
+            # their locations change
+            tiles = sorted(filter(None, self.tiles), key=lambda tile: tile.id)
+            for tile in tiles:
+                self.gamegrid.removeWidget(tile)
+                tile.current_alpha = 255  # in case the game was stopped mid fade
+                tile.show()
+        else:
+            # Set the grid size
+            self.grid_size = grid_size
+            self._build_neighbor_table()
 
-        # Calculate the tile width and height based on the grid size
-        tile_width = self.image.height() / self.grid_size
-        tile_height = self.image.height() / self.grid_size
+            # Clear the tiles of the previous game
+            self.reset_holders()
 
-        # Set up the tiles
-        self.image_fraction = {}
-        for col in range(self.grid_size):
-            for row in range(self.grid_size):
-                self.image_fraction[(row, col)] = self.image.copy(
-                    col * tile_width, row * tile_height, tile_width, tile_height
-                )
-                self.tiles[(row, col)] = Tile(
-                    (row, col), self.image_fraction[(row, col)]
-                )
-                self.tiles[(row, col)].setPixmap(self.image_fraction[(row, col)])
-                self.gamegrid.addWidget(self.tiles[(row, col)], row, col, 1, 1)
-                self.tiles[(row, col)].clicked.connect(self.tile_clicked)
+            # The whole image label spans the whole grid for the won state
+            self.gamegrid.removeWidget(self.image_label)
+            self.gamegrid.addWidget(
+                self.image_label, 0, 0, self.grid_size, self.grid_size
+            )
+            tiles = self._create_tiles()
+        self.image_label.hide()
 
-        # Remove the last tile
-        self.gamegrid.removeItem(
-            self.gamegrid.itemAtPosition(self.grid_size - 1, self.grid_size - 1)
-        )
+        # The empty tile starts in the bottom right corner
         self.current_empty_tile = (self.grid_size - 1, self.grid_size - 1)
-        self.tiles[self.current_empty_tile].deleteLater()  # Also from memory
-
-        # Finally we shuffle the tiles by making random moves
-        while True:
-            # We make grid_size**2 random moves
-            for _ in range(self.grid_size**2):
-                # Get the moveable tiles
-                neightbors = self.get_neightbor_tiles(self.current_empty_tile)
-                # Pick a random tile
-                tile = self.tiles[neightbors[randint(0, len(neightbors) - 1)]]
-                # Move the tile
-                self.move_tile(tile)
-
-            # Check if the empty tile is in the bottom right corner
-            if self.current_empty_tile == (self.grid_size - 1, self.grid_size - 1):
-                # Check if the game is not won (in case the shuffle created solved game)
-                if not self.check_win():
-                    # Stop the shuffling loop
-                    break
-            # If the game is won or the bottom right corner tile is not empty
-            # then we shuffle again until both conditions are met
+
+        # Finally we shuffle the tiles with a random permutation. The empty tile
+        # stays in the bottom right corner, so the puzzle is solvable only when
+        # the permutation has an even number of inversions
+        ordered = list(range(len(tiles)))
+        permutation = ordered
+        # Shuffle again in case the shuffle created solved game
+        while permutation == ordered:
+            permutation = sample(ordered, len(ordered))
+            if inversion_count(permutation) % 2:
+                # Swapping two tiles flips the parity of the permutation
+                permutation[0], permutation[1] = permutation[1], permutation[0]
+
+        # Place the tiles directly in their shuffled locations
+        self.tiles = [None] * self.grid_size**2
+        self._wrong_count = 0
+        for index, tile_id in enumerate(permutation):
+            tile = tiles[tile_id]
+            tile.location = divmod(index, self.grid_size)
+            self.tiles[index] = tile
+            self.gamegrid.addWidget(tile, *tile.location)
+            self._wrong_count += not tile.is_in_right_place()
+        self.setUpdatesEnabled(True)
 
         # Flag the game as running and reset the counter
         self.game_running = True
         self.counter = 0
 
+    def _create_tiles(self):
+        """Creates the tiles for the grid size, ordered by their id"""
+        # Calculate the tile edges based on the grid size, in whole pixels so the
+        # tiles cover the image without gaps or overlaps
+        edges = [
+            self.image.height() * i // self.grid_size for i in range(self.grid_size + 1)
+        ]
+
+        # Set up the tiles, each one draws its own fraction of the whole image
+        # The last tile is the empty one, it is not created
+        tiles = []
+        for row in range(self.grid_size):
+            for col in range(self.grid_size):
+                if (row, col) == (self.grid_size - 1, self.grid_size - 1):
+                    continue
+                tile = Tile(
+                    (row, col),
+                    self.image,
+                    QRect(
+                        edges[col],
+                        edges[row],
+                        edges[col + 1] - edges[col],
+                        edges[row + 1] - edges[row],
+                    ),
+                )
+                tile.clicked.connect(partial(self.tile_clicked, tile))
+                tile.faded_out.connect(self._do_swap)
+                tile.faded_in.connect(self._finish_move)
+                tiles.append(tile)
+        return tiles
+
     def check_win(self):
         """Checks if the game is won"""
-        # Loop through the tiles and check if they are in the right place
-        for tile in self.tiles.values():
-            # If one tile is not in the right place then the game is not won
-            if not tile.is_in_right_place():
-                return False
-        # If all tiles are in the right place then the game is won
-        return True
+        # The count of misplaced tiles is kept up to date by each move
+        return self._wrong_count == 0
 
     def move_tile(self, tile, mode="normal"):
         """Moves the tile to the new location"""
         # Increment the counter
         self.counter += 1
 
+        # Apply the fade effect if mode is fade, the rest of the move is then
+        # driven by the faded_out and faded_in signals of the tile
+        if mode == "fade":
+            self._begin_move(tile)
+            return
+
+        self._swap_tile(tile)
+        self._relocate_tile(tile)
+
+    def _begin_move(self, tile):
+        """Starts a faded move by fading out the tile"""
+        self.moving_tile = tile
+        tile.fade_out()
+
+    def _do_swap(self):
+        """Slot function for when the moving tile has faded out"""
+        tile = self.moving_tile
+        # The move was cancelled (game stopped or reset)
+        if tile is None:
+            return
+        self._swap_tile(tile)
+        tile.fade_in()
+
+    def _finish_move(self):
+        """Slot function for when the moving tile has faded in"""
+        tile = self.moving_tile
+        # The move was cancelled (game stopped or reset)
+        if tile is None:
+            return
+        self.moving_tile = None
+        self._relocate_tile(tile)
+        # Check if the game is won
+        if self.check_win():
+            # Set the game to won state
+            self.set_won_state()
+
+    def _relocate_tile(self, tile):
+        """Swaps the locations of the tile and the empty tile"""
+        was_right = tile.is_in_right_place()
+        # Swap the locations of the tiles (hidden tile and the tile that was clicked)
+        self.current_empty_tile, tile.location = tile.location, self.current_empty_tile
+        # Only the moved tile can change the count, the empty tile is not counted
+        self._wrong_count += int(was_right) - int(tile.is_in_right_place())
+
+    def _swap_tile(self, tile):
+        """Swaps the tile with the empty tile on the grid"""
         new_location = self.current_empty_tile
         row, col = new_location
 
-        # Apply the fade out effect if mode is fade
-        if mode == "fade":
-            tile.fade_out()
-            # Wait until the fade out effect is done
-            while tile.fade_out_timer.isActive():
-                sleep(0.01)
-                app.processEvents()
         # Remove the tile from the grid
         self.gamegrid.removeWidget(tile)
 
-        # Update the empty tile inner location
-        self.tiles[self.current_empty_tile].location = tile.location
-
         # Swap the tiles (hidden tile and the tile that was clicked)
-        self.tiles[tile.location], self.tiles[new_location] = self.tiles.pop(
-            new_location
-        ), self.tiles.pop(tile.location)
+        old_index = self.tile_index(*tile.location)
+        new_index = self.tile_index(row, col)
+        self.tiles[old_index], self.tiles[new_index] = (
+            self.tiles[new_index],
+            self.tiles[old_index],
+        )
 
         # Add the tile to the new location
         self.gamegrid.addWidget(tile, row, col)
-        if mode == "fade":
-            tile.fade_in()
-            # Wait until the fade in effect is done
-            while tile.fade_in_timer.isActive():
-                sleep(0.01)
-                app.processEvents()
-        # Swap the locations of the tiles (hidden tile and the tile that was clicked)
-        self.current_empty_tile, tile.location = tile.location, new_location
+
+    def fade_tile(self, tile, direction):
+        """Starts fading the tile out (direction -1) or in (direction 1)"""
+        self._anim_tile = tile
+        self._anim_dir = direction
+        self._anim_timer.start(tile.fade_step_duration)
+
+    def stop_fade(self):
+        """Stops the running fade effect if any"""
+        self._anim_timer.stop()
+        self._anim_tile = None
+
+    def _tick_fade(self):
+        """Slot function for the animation timer, steps the alpha of the faded tile"""
+        tile = self._anim_tile
+        # Check if the alpha value can still be changed in the fading direction
+        if (self._anim_dir < 0 and tile.current_alpha > 0) or (
+            self._anim_dir > 0 and tile.current_alpha < 255
+        ):
+            tile.current_alpha = min(
+                max(tile.current_alpha + tile.fade_step * self._anim_dir, 0), 255
+            )
+            tile.update()  # Trigger a repaint to show the updated alpha
+            return
+
+        # Stop the timer before notifying as the next fade may start right away
+        self.stop_fade()
+        if self._anim_dir < 0:
+            tile.faded_out.emit()
+        else:
+            tile.faded_in.emit()
 
     def tile_is_empty(self, location):
         """Returns true if the tile at the location is empty"""
         row, col = location
-        # Nothing on this location on the grid, then it is empty
-        if self.gamegrid.itemAtPosition(row, col) is None:
-            return True
-        return False
+        # No tile on this location, then it is empty. The grid can not be used
+        # for this as the hidden whole image label spans every location
+        return self.tiles[self.tile_index(row, col)] is None
+
+    def _build_neighbor_table(self):
+        """Precomputes the neightbor tiles of every location for the grid size"""
+        self._neighbor_table = {}
+        for row in range(self.grid_size):
+            for col in range(self.grid_size):
+                # Keep the neightbors that are inside the grid
+                self._neighbor_table[(row, col)] = tuple(
+                    (row + d_row, col + d_col)
+                    for d_row, d_col in ((-1, 0), (1, 0), (0, -1), (0, 1))
+                    if 0 <= row + d_row < self.grid_size
+                    and 0 <= col + d_col < self.grid_size
+                )
 
     def get_neightbor_tiles(self, location):
         """Returns the neightbor tiles of the tile at the location"""
-        row, col = location
-        neightbors = []
-        # Check if the tile is not in the first row
-        if row > 0:
-            neightbors.append((row - 1, col))
-        # Check if the tile is not in the last row
-        if row < self.grid_size - 1:
-            neightbors.append((row + 1, col))
-        # Check if the tile is not in the first column
-        if col > 0:
-            neightbors.append((row, col - 1))
-        # Check if the tile is not in the last column
-        if col < self.grid_size - 1:
-            neightbors.append((row, col + 1))
-        return neightbors
+        return self._neighbor_table[location]
 
     def moveable_tile(self, location):
         """Returns true if the tile is moveable, next to the empty tile"""
-        return self.current_empty_tile in self.get_neightbor_tiles(location)
+        return self.current_empty_tile in self._neighbor_table[location]
 
     def load_image(self, file_path=None, hint_width=150, hint_image=None):
         """Loads an image from the file path specified in the line edit widget."""
@@ -356,6 +463,13 @@ class Gameboard(QWidget):
 
         # Clear previous image and grid
         self.reset_holders()
+        try:
+            # delete the image label from the memory ### important
+            self.image_label.deleteLater()
+            self.image_label = None
+        except (RuntimeError, AttributeError):
+            # if the image label is not in the memory then pass
+            pass
 
         # Read image
         if self.file_path:
@@ -367,7 +481,10 @@ class Gameboard(QWidget):
 
         # Scale the image to the window height
         self.image = self.image.scaled(
-            self.window_height, self.window_height, Qt.KeepAspectRatio
+            self.window_height,
+            self.window_height,
+            Qt.KeepAspectRatio,
+            Qt.SmoothTransformation,
         )
 
         # Create the large image label and add image to it
@@ -377,14 +494,11 @@ class Gameboard(QWidget):
         # Add the image label to the grid
         self.gamegrid.addWidget(self.image_label, 0, 0)
 
-        # Update the image hint to the new image
-        self.image_hint = self.image.copy(
-            0, 0, self.image.height(), self.image.height()
-        )
-
-        # Scale the image hint to the new width
-        self.image_hint = self.image_hint.scaled(
-            hint_width, hint_width, Qt.KeepAspectRatio
+        # Update the image hint to the new image, scaled to the new width
+        # The image is already square so it can be scaled directly, and the hint is
+        # a small thumbnail so the fast transformation is enough
+        self.image_hint = self.image.scaled(
+            hint_width, hint_width, Qt.KeepAspectRatio, Qt.FastTransformation
         )
         hint_image.setPixmap(self.image_hint)
 
@@ -406,7 +520,7 @@ class MainWindow(QMainWindow):
 
         # Set flags and timer
         self.game_running = False
-        self.time_ref = None
+        self.elapsed_timer = QElapsedTimer()
         self.side_panel_width = 200
         self.timer = QTimer()
 
@@ -482,9 +596,7 @@ class MainWindow(QMainWindow):
 
         # Connect signals
         self.browse_button.clicked.connect(self.browse_n_load)
-        self.toggle_button.clicked.connect(
-            lambda: self.gameboard.shuffle(self.spinner.value())
-        )
+        self.toggle_button.clicked.connect(self._on_toggle_clicked)
         self.toggle_button.clicked.connect(self.toggle_game_state)
         self.gameboard.won_signal.connect(self.won_game)
         self.timer.timeout.connect(self.refresh_status)
@@ -498,11 +610,15 @@ class MainWindow(QMainWindow):
         self.showMaximized()
         self.show()
 
+    def _on_toggle_clicked(self):
+        """Shuffles the gameboard with the selected grid size."""
+        self.gameboard.shuffle(self.spinner.value())
+
     def toggle_game_state(self):
         """Starts\stops the timer and sets the game to running."""
         if not self.game_running:
-            # Start the timer and update the time reference
-            self.time_ref = datetime.now()
+            # Start the timer and the elapsed time reference
+            self.elapsed_timer.start()
             self.timer.start(100)
             self.game_running = True
             # Update the timer text and disable browse button
@@ -526,9 +642,8 @@ class MainWindow(QMainWindow):
         self.game_running = False
 
         # Calculate the game duration and update the timer text
-        game_duration = str(datetime.now() - self.time_ref).split(".")[0][2:]
         text_message = (
-            f"You won\nTime: {game_duration}\nMoves: {self.gameboard.counter}"
+            f"You won\nTime: {self.game_duration()}\nMoves: {self.gameboard.counter}"
         )
         self.status_text.setText(text_message)
 
@@ -536,12 +651,16 @@ class MainWindow(QMainWindow):
         self.toggle_button.setText("Start game")
         self.browse_button.setEnabled(True)
 
+    def game_duration(self):
+        """Returns the time elapsed since the game started as minutes:seconds."""
+        seconds = self.elapsed_timer.elapsed() // 1000
+        minutes, seconds = divmod(seconds, 60)
+        return f"{minutes:02d}:{seconds:02d}"
+
     def refresh_status(self):
         """Refreshes the status text and status bar."""
         if self.game_running:
-            self.status_text.setText(
-                str(datetime.now() - self.time_ref).split(".")[0][2:]
-            )
+            self.status_text.setText(self.game_duration())
             self.statusBar().showMessage("Moves: " + str(self.gameboard.counter))
 
     def browse_n_load(self):